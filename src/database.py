@@ -1,5 +1,5 @@
 import sqlite3
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 
@@ -29,10 +29,20 @@ class DatabaseManager:
                 customer_phone TEXT,
                 customer_address TEXT,
                 invoice_date TEXT,
-                total_amount REAL
+                total_amount REAL,
+                pdf_path TEXT,
+                pdf_size INTEGER,
+                pdf_checksum TEXT
             )
         ''')
         
+        # Add PDF columns to databases created before they existed
+        self.cursor.execute('PRAGMA table_info(invoices)')
+        existing_columns = {row[1] for row in self.cursor.fetchall()}
+        for column, column_type in (('pdf_path', 'TEXT'), ('pdf_size', 'INTEGER'), ('pdf_checksum', 'TEXT')):
+            if column not in existing_columns:
+                self.cursor.execute(f'ALTER TABLE invoices ADD COLUMN {column} {column_type}')
+        
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS invoice_items (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -121,6 +131,49 @@ class DatabaseManager:
             logging.error(f"Error retrieving invoice: {e}")
             raise
     
+    def update_invoice_pdf(self, invoice_id: int, pdf_path: str, pdf_size: int, pdf_checksum: str):
+        """
+        Record the location, size and checksum of an invoice's rendered PDF
+        
+        Args:
+            invoice_id (int): Invoice identifier
+            pdf_path (str): Path to the PDF file, relative to the PDF output directory
+            pdf_size (int): PDF size in bytes
+            pdf_checksum (str): SHA-256 hex digest of the PDF
+        """
+        try:
+            self.cursor.execute('''
+                UPDATE invoices 
+                SET pdf_path = ?, pdf_size = ?, pdf_checksum = ?
+                WHERE invoice_id = ?
+            ''', (pdf_path, pdf_size, pdf_checksum, invoice_id))
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logging.error(f"Error updating invoice PDF: {e}")
+            raise
+    
+    def get_invoice_pdf(self, invoice_id: int) -> Optional[Tuple]:
+        """
+        Retrieve the stored PDF path, size and checksum of an invoice
+        
+        Args:
+            invoice_id (int): Invoice identifier
+        
+        Returns:
+            tuple: (pdf_path, pdf_size, pdf_checksum), or None if the invoice does not exist.
+                pdf_path is relative to the PDF output directory.
+        """
+        try:
+            self.cursor.execute(
+                'SELECT pdf_path, pdf_size, pdf_checksum FROM invoices WHERE invoice_id = ?', 
+                (invoice_id,)
+            )
+            return self.cursor.fetchone()
+        except sqlite3.Error as e:
+            logging.error(f"Error retrieving invoice PDF: {e}")
+            raise
+    
     def close(self):
         """Close database connection"""
         self.conn.close()
\ No newline at end of file
@@ -1,15 +1,27 @@
+import os
 import logging
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Optional
 from .database import DatabaseManager
-from .pdf_creator import PDFInvoiceGenerator
+from .pdf_creator import PDF_LAYOUTS, PDFInvoiceGenerator
 
 class InvoiceSystem:
-    def __init__(self, database_path: str = 'data/invoices.db'):
+    def __init__(
+        self, 
+        database_path: str = 'data/invoices.db', 
+        output_dir: str = 'invoices', 
+        pdf_layout: str = 'flat'
+    ):
         """
         Initialize invoice system with database connection
         
         Args:
             database_path (str): Path to SQLite database
+            output_dir (str): Root directory for generated PDFs
+            pdf_layout (str): PDF directory layout ('flat', 'date' or 'hash')
+        
+        PDF paths are stored in the database relative to output_dir, so the
+        archive can be moved or re-rooted by pointing output_dir at it.
         """
         logging.basicConfig(
             filename='logs/invoice_system.log', 
@@ -18,6 +30,12 @@ class InvoiceSystem:
         )
         
         self.db_manager = DatabaseManager(database_path)
+        
+        if pdf_layout not in PDF_LAYOUTS:
+            raise ValueError(f"Unknown PDF layout: {pdf_layout}")
+        
+        self.output_dir = output_dir
+        self.pdf_layout = pdf_layout
     
     def create_invoice(self, customer_info: Dict, items: List[Dict]) -> Dict:
         """
@@ -37,11 +55,25 @@ class InvoiceSystem:
             # Insert invoice to database
             invoice_id = self.db_manager.insert_invoice(customer_info, items)
             
-            # Generate PDF
+            # Generate PDF dated (and sharded) by the stored invoice date
+            invoice, _ = self.db_manager.get_invoice(invoice_id)
+            invoice_date = datetime.strptime(invoice[5], "%Y-%m-%d")
             pdf_path = PDFInvoiceGenerator.generate_invoice_pdf(
                 invoice_id, 
                 customer_info, 
-                items
+                items,
+                output_dir=self.output_dir,
+                layout=self.pdf_layout,
+                invoice_date=invoice_date
+            )
+            
+            # Record PDF location (relative to output_dir) and checksum
+            pdf_metadata = PDFInvoiceGenerator.get_pdf_metadata(pdf_path)
+            self.db_manager.update_invoice_pdf(
+                invoice_id, 
+                os.path.relpath(pdf_path, self.output_dir), 
+                pdf_metadata['pdf_size'], 
+                pdf_metadata['pdf_checksum']
             )
             
             # Log invoice creation
@@ -98,6 +130,29 @@ class InvoiceSystem:
         """
         return self.db_manager.get_invoice(invoice_id)
     
+    def verify_invoice_pdf(self, invoice_id: int) -> Optional[bool]:
+        """
+        Check that an invoice's PDF exists and matches its stored size and checksum
+        
+        Args:
+            invoice_id (int): Invoice identifier
+        
+        Returns:
+            bool: True if the PDF is present and unchanged, False if it is
+                missing or modified, None if no PDF is recorded for the invoice
+                (e.g. invoices created before PDF paths were stored)
+        """
+        pdf_record = self.db_manager.get_invoice_pdf(invoice_id)
+        if not pdf_record or not pdf_record[0]:
+            return None
+        
+        relative_path, pdf_size, pdf_checksum = pdf_record
+        pdf_path = os.path.join(self.output_dir, relative_path)
+        if not os.path.isfile(pdf_path) or os.path.getsize(pdf_path) != pdf_size:
+            return False
+        
+        return PDFInvoiceGenerator.get_pdf_metadata(pdf_path)['pdf_checksum'] == pdf_checksum
+    
     def __del__(self):
         """Close database connection when object is destroyed"""
         self.db_manager.close()
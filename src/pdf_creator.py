@@ -1,4 +1,5 @@
 import os
+import hashlib
 from datetime import datetime
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -10,7 +11,61 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib import colors
 from typing import Dict, List, Optional, Union
 
+PDF_LAYOUTS = ('flat', 'date', 'hash')
+
 class PDFInvoiceGenerator:
+    @staticmethod
+    def get_pdf_dir(
+        output_dir: str, 
+        invoice_number: str, 
+        layout: str = 'flat',
+        invoice_date: Optional[datetime] = None
+    ) -> str:
+        """
+        Resolve the directory an invoice PDF is stored in
+        
+        Args:
+            output_dir (str): Root directory for invoice PDFs
+            invoice_number (str): Invoice number shown on the PDF
+            layout (str): 'flat' (single directory), 'date' (YYYY/MM)
+                or 'hash' (two-level hex prefix of the invoice number)
+            invoice_date (datetime): Date used by the 'date' layout
+        
+        Returns:
+            str: Directory path for the PDF
+        """
+        if layout == 'flat':
+            return output_dir
+        if layout == 'date':
+            invoice_date = invoice_date or datetime.now()
+            return os.path.join(output_dir, invoice_date.strftime("%Y"), invoice_date.strftime("%m"))
+        if layout == 'hash':
+            digest = hashlib.sha1(invoice_number.encode('utf-8')).hexdigest()
+            return os.path.join(output_dir, digest[:2], digest[2:4])
+        raise ValueError(f"Unknown PDF layout: {layout}")
+
+    @staticmethod
+    def get_pdf_metadata(pdf_path: str) -> Dict:
+        """
+        Compute size and SHA-256 checksum of a rendered PDF
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+        
+        Returns:
+            dict: 'pdf_path', 'pdf_size' and 'pdf_checksum'
+        """
+        sha256 = hashlib.sha256()
+        with open(pdf_path, 'rb') as pdf_file:
+            for chunk in iter(lambda: pdf_file.read(65536), b''):
+                sha256.update(chunk)
+        
+        return {
+            'pdf_path': pdf_path,
+            'pdf_size': os.path.getsize(pdf_path),
+            'pdf_checksum': sha256.hexdigest()
+        }
+
     @staticmethod
     def generate_invoice_pdf(
         invoice_id: Union[int, str], 
@@ -18,22 +73,34 @@ class PDFInvoiceGenerator:
         items: List[Dict], 
         output_dir: str = 'invoices', 
         logo_path: Optional[str] = "images/images.jpeg",
-        custom_invoice_number: Optional[str] = None
+        custom_invoice_number: Optional[str] = None,
+        layout: str = 'flat',
+        invoice_date: Optional[datetime] = None
     ) -> str:
         """
         Generate a PDF invoice with enhanced formatting and consistent margins
-        """
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
         
+        The invoice date (defaults to today) is printed on the PDF and
+        selects the directory for the 'date' layout.
+        """
         # Determine invoice number
         display_invoice_number = (
             custom_invoice_number if custom_invoice_number 
             else str(invoice_id)
         )
         
+        # Resolve (sharded) output directory and ensure it exists
+        invoice_date = invoice_date or datetime.now()
+        pdf_dir = PDFInvoiceGenerator.get_pdf_dir(
+            output_dir, 
+            display_invoice_number, 
+            layout, 
+            invoice_date
+        )
+        os.makedirs(pdf_dir, exist_ok=True)
+        
         # Generate PDF path
-        pdf_path = os.path.join(output_dir, f'invoice_{display_invoice_number}.pdf')
+        pdf_path = os.path.join(pdf_dir, f'invoice_{display_invoice_number}.pdf')
         
         # Set up document with margins
         margin = 0.25 * inch
@@ -62,7 +129,7 @@ class PDFInvoiceGenerator:
                 print(f"Warning: Could not load logo: {e}")
         
         # Today's Date
-        today = datetime.now().strftime("%B %d, %Y")
+        today = invoice_date.strftime("%B %d, %Y")
         
         # Invoice Number and Date Paragraphs
         invoice_header_style = styles['Normal'].clone('InvoiceHeader')
@@ -0,0 +1,70 @@
+import sqlite3
+
+import pytest
+
+from src.database import DatabaseManager
+
+
+CUSTOMER_INFO = {
+    'name': 'Jane Doe',
+    'email': 'jane.doe@example.com',
+    'phone': '(555) 123-4567',
+    'address': '123 Business Street, Anytown, USA'
+}
+
+ITEMS = [
+    {
+        'product_name': 'Consulting Services',
+        'quantity': 5,
+        'price': 200.00,
+        'description': 'Strategic business consultation'
+    }
+]
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(str(tmp_path / 'invoices.db'))
+    yield manager
+    manager.close()
+
+
+def test_migrates_old_invoices_schema(tmp_path):
+    database_path = str(tmp_path / 'old.db')
+    conn = sqlite3.connect(database_path)
+    conn.execute('''
+        CREATE TABLE invoices (
+            invoice_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            customer_name TEXT,
+            customer_email TEXT,
+            customer_phone TEXT,
+            customer_address TEXT,
+            invoice_date TEXT,
+            total_amount REAL
+        )
+    ''')
+    conn.execute(
+        "INSERT INTO invoices (customer_name, invoice_date, total_amount) VALUES ('Old', '2024-01-31', 10.0)"
+    )
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(database_path)
+    manager.cursor.execute('PRAGMA table_info(invoices)')
+    columns = [row[1] for row in manager.cursor.fetchall()]
+
+    assert columns[-3:] == ['pdf_path', 'pdf_size', 'pdf_checksum']
+    assert manager.get_invoice_pdf(1) == (None, None, None)
+    manager.close()
+
+
+def test_update_and_get_invoice_pdf(db_manager):
+    invoice_id = db_manager.insert_invoice(CUSTOMER_INFO, ITEMS)
+
+    db_manager.update_invoice_pdf(invoice_id, 'ab/cd/invoice_1.pdf', 1234, 'deadbeef')
+
+    assert db_manager.get_invoice_pdf(invoice_id) == ('ab/cd/invoice_1.pdf', 1234, 'deadbeef')
+
+
+def test_get_invoice_pdf_unknown_invoice(db_manager):
+    assert db_manager.get_invoice_pdf(999) is None
@@ -0,0 +1,132 @@
+import hashlib
+import os
+from datetime import datetime
+
+import pytest
+
+from src.invoice_generator import InvoiceSystem
+from src.pdf_creator import PDFInvoiceGenerator
+
+
+CUSTOMER_INFO = {
+    'name': 'Jane Doe',
+    'email': 'jane.doe@example.com',
+    'phone': '(555) 123-4567',
+    'address': '123 Business Street, Anytown, USA'
+}
+
+ITEMS = [
+    {
+        'product_name': 'Consulting Services',
+        'quantity': 5,
+        'price': 200.00,
+        'description': 'Strategic business consultation'
+    }
+]
+
+
+def test_get_pdf_dir_flat():
+    assert PDFInvoiceGenerator.get_pdf_dir('invoices', '7') == 'invoices'
+
+
+def test_get_pdf_dir_date():
+    pdf_dir = PDFInvoiceGenerator.get_pdf_dir('invoices', '7', 'date', datetime(2024, 1, 31))
+
+    assert pdf_dir == os.path.join('invoices', '2024', '01')
+
+
+def test_get_pdf_dir_hash():
+    digest = hashlib.sha1(b'7').hexdigest()
+
+    pdf_dir = PDFInvoiceGenerator.get_pdf_dir('invoices', '7', 'hash')
+
+    assert pdf_dir == os.path.join('invoices', digest[:2], digest[2:4])
+
+
+def test_get_pdf_dir_unknown_layout():
+    with pytest.raises(ValueError):
+        PDFInvoiceGenerator.get_pdf_dir('invoices', '7', 'bogus')
+
+
+@pytest.fixture
+def invoice_system(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('logs')
+
+    def fake_generate_invoice_pdf(invoice_id, customer_info, items, output_dir='invoices',
+                                  layout='flat', invoice_date=None, **kwargs):
+        pdf_dir = PDFInvoiceGenerator.get_pdf_dir(output_dir, str(invoice_id), layout, invoice_date)
+        os.makedirs(pdf_dir, exist_ok=True)
+        pdf_path = os.path.join(pdf_dir, f'invoice_{invoice_id}.pdf')
+        with open(pdf_path, 'wb') as pdf_file:
+            pdf_file.write(b'%PDF-1.4 dummy invoice')
+        return pdf_path
+
+    monkeypatch.setattr(PDFInvoiceGenerator, 'generate_invoice_pdf', fake_generate_invoice_pdf)
+
+    return InvoiceSystem(
+        database_path=str(tmp_path / 'invoices.db'),
+        output_dir=str(tmp_path / 'invoices'),
+        pdf_layout='hash'
+    )
+
+
+def test_unknown_pdf_layout(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('logs')
+
+    with pytest.raises(ValueError):
+        InvoiceSystem(database_path=str(tmp_path / 'invoices.db'), pdf_layout='bogus')
+
+
+def test_create_invoice_records_relative_pdf_path(invoice_system):
+    invoice = invoice_system.create_invoice(CUSTOMER_INFO, ITEMS)
+
+    pdf_path, pdf_size, pdf_checksum = invoice_system.db_manager.get_invoice_pdf(invoice['invoice_id'])
+
+    assert not os.path.isabs(pdf_path)
+    assert os.path.join(invoice_system.output_dir, pdf_path) == invoice['pdf_path']
+    assert pdf_size == os.path.getsize(invoice['pdf_path'])
+    assert pdf_checksum == PDFInvoiceGenerator.get_pdf_metadata(invoice['pdf_path'])['pdf_checksum']
+
+
+def test_verify_invoice_pdf_detects_modified_file(invoice_system):
+    invoice = invoice_system.create_invoice(CUSTOMER_INFO, ITEMS)
+
+    assert invoice_system.verify_invoice_pdf(invoice['invoice_id']) is True
+
+    with open(invoice['pdf_path'], 'wb') as pdf_file:
+        pdf_file.write(b'%PDF-1.4 tampered invoice')
+
+    assert invoice_system.verify_invoice_pdf(invoice['invoice_id']) is False
+
+
+def test_verify_invoice_pdf_detects_deleted_file(invoice_system):
+    invoice = invoice_system.create_invoice(CUSTOMER_INFO, ITEMS)
+
+    os.remove(invoice['pdf_path'])
+
+    assert invoice_system.verify_invoice_pdf(invoice['invoice_id']) is False
+
+
+def test_verify_invoice_pdf_without_recorded_pdf(invoice_system):
+    invoice_id = invoice_system.db_manager.insert_invoice(CUSTOMER_INFO, ITEMS)
+
+    assert invoice_system.verify_invoice_pdf(invoice_id) is None
+
+
+def test_generate_invoice_pdf_uses_invoice_date_shard(tmp_path):
+    output_dir = str(tmp_path / 'invoices')
+
+    pdf_path = PDFInvoiceGenerator.generate_invoice_pdf(
+        7,
+        CUSTOMER_INFO,
+        ITEMS,
+        output_dir=output_dir,
+        logo_path=None,
+        layout='date',
+        invoice_date=datetime(2024, 1, 31)
+    )
+
+    assert pdf_path == os.path.join(output_dir, '2024', '01', 'invoice_7.pdf')
+    assert os.path.isfile(pdf_path)